@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 import uvicorn
 from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import Row
 
 from api import utils
 from api.validator import CookieSessionForm, TaskForm, UserForm
@@ -60,7 +61,7 @@ async def login(user_form: UserForm, response: Response, request: Request) -> di
     print(f"User {user_form.username} is trying to login")
 
     with Database() as db:
-        user: User | None = db.check_if_user_exists(
+        user: Row | None = db.check_if_user_exists(
             username=user_form.username, hashed_password=user_form.hashed_password
         )
         if user is None:
@@ -2,9 +2,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Callable, Optional
 
 from fastapi import Header, HTTPException, Request
+from sqlalchemy import Row
 
 from database.database import Database
-from database.models import CookieSession
 
 
 async def check_auth_token(request: Request) -> None:
@@ -24,7 +24,7 @@ async def check_auth_token(request: Request) -> None:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     with Database() as db:
-        cookie_session: CookieSession | None = db.get_session(token=token)
+        cookie_session: Row | None = db.get_session(token=token)
         if not cookie_session:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
@@ -32,7 +32,7 @@ async def check_auth_token(request: Request) -> None:
             db.deactivate_session(token=token)
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        if cookie_session.user.role != role:
+        if cookie_session.role != role:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
         expires_at = datetime.now(tz=timezone.utc) + timedelta(weeks=4)
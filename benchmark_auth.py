@@ -0,0 +1,97 @@
+import timeit
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from database.database import Database
+from database.models import CookieSession, User
+
+NUMBER = 2000
+REPEAT = 5
+
+TOKEN = "token"
+USERNAME = "johndoe"
+HASHED_PASSWORD = "password"
+
+
+def orm_lazy_get_session(db: Database) -> str:
+    # Old auth path: full ORM entity, plus a second query to lazy load the user for the role check
+    cookie_session = db.session.query(CookieSession).filter(CookieSession.token == TOKEN).first()
+    return cookie_session.user.role
+
+
+def orm_joined_get_session(db: Database) -> str:
+    # Full ORM entities, but the user is fetched in the same query
+    cookie_session = (
+        db.session.query(CookieSession)
+        .options(joinedload(CookieSession.user))
+        .filter(CookieSession.token == TOKEN)
+        .first()
+    )
+    return cookie_session.user.role
+
+
+def columns_per_call_get_session(db: Database) -> str:
+    # Same SQL as the prebuilt statement, but the select() is rebuilt on every call
+    query = (
+        select(CookieSession.token, CookieSession.user_uuid, CookieSession.expires_at, User.role)
+        .join(User, CookieSession.user_uuid == User.uuid)
+        .where(CookieSession.token == TOKEN)
+        .limit(1)
+    )
+    return db.session.execute(query).first().role
+
+
+def orm_check_if_user_exists(db: Database) -> str:
+    user = (
+        db.session.query(User)
+        .filter(
+            User.username == USERNAME,
+            User.hashed_password == HASHED_PASSWORD,
+            User.is_active.is_(True),
+        )
+        .first()
+    )
+    return user.role
+
+
+def columns_per_call_check_if_user_exists(db: Database) -> str:
+    query = (
+        select(User.uuid, User.role)
+        .where(
+            User.username == USERNAME,
+            User.hashed_password == HASHED_PASSWORD,
+            User.is_active.is_(True),
+        )
+        .limit(1)
+    )
+    return db.session.execute(query).first().role
+
+
+def benchmark(db: Database, name: str, func: Callable[[], object]) -> None:
+    def _call() -> None:
+        func()
+        # Reset the identity map on every row alike, so ORM rows never reuse already loaded objects
+        db.session.expunge_all()
+
+    best = min(timeit.repeat(_call, number=NUMBER, repeat=REPEAT)) / NUMBER
+    print(f"    {name:<45} {best * 1_000_000:8.1f} us/call")
+
+
+if __name__ == "__main__":
+    with Database() as db:
+        print(f"get_session, best of {REPEAT} x {NUMBER} calls...")
+        benchmark(db, "ORM entity + N+1 lazy load", lambda: orm_lazy_get_session(db))
+        benchmark(db, "ORM entity + joinedload(user)", lambda: orm_joined_get_session(db))
+        benchmark(db, "columns, select() built per call", lambda: columns_per_call_get_session(db))
+        benchmark(db, "columns, prebuilt select()", lambda: db.get_session(token=TOKEN).role)
+
+        print(f"\ncheck_if_user_exists, best of {REPEAT} x {NUMBER} calls...")
+        benchmark(db, "ORM entity", lambda: orm_check_if_user_exists(db))
+        benchmark(db, "columns, select() built per call", lambda: columns_per_call_check_if_user_exists(db))
+        benchmark(
+            db,
+            "columns, prebuilt select()",
+            lambda: db.check_if_user_exists(username=USERNAME, hashed_password=HASHED_PASSWORD).role,
+        )
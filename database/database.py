@@ -5,12 +5,38 @@ from uuid import UUID
 
 import sqlalchemy as sa
 from loguru import logger
-from sqlalchemy import Engine, engine, update
+from sqlalchemy import Engine, Row, bindparam, engine, select, update
 from sqlalchemy.orm import Session
 from tenacity import retry, stop_after_attempt, wait_random
 
 from database.models import Base, CookieSession, Task, User
 
+#
+# ---- Prebuilt Statements ----
+#
+# Hot-path lookups are built once at import time with bound parameters, so each call
+# only binds values instead of rebuilding the statement and regenerating its cache key.
+#
+
+SELECT_USER_BY_CREDENTIALS = (
+    select(User.uuid, User.role)
+    .where(
+        User.username == bindparam("username"),
+        User.hashed_password == bindparam("hashed_password"),
+        User.is_active.is_(True),
+    )
+    .limit(1)
+)
+
+SELECT_SESSION_BY_TOKEN = (
+    select(CookieSession.token, CookieSession.user_uuid, CookieSession.expires_at, User.role)
+    .join(User, CookieSession.user_uuid == User.uuid)
+    .where(CookieSession.token == bindparam("token"))
+    .limit(1)
+)
+
+SELECT_USER_BY_UUID = select(User).where(User.uuid == bindparam("user_uuid")).limit(1)
+
 
 class Database:
     def __init__(self):
@@ -53,16 +79,11 @@ class Database:
     # ---- Cookie Session Methods ----
     #
 
-    def check_if_user_exists(self, username: str, hashed_password: str) -> User | None:
-        query = (
-            self.session.query(User)
-            .filter(
-                User.username == username,
-                User.hashed_password == hashed_password,
-                User.is_active.is_(True),
-            )
-            .first()
-        )
+    def check_if_user_exists(self, username: str, hashed_password: str) -> Row[tuple[UUID, str]] | None:
+        query = self.session.execute(
+            SELECT_USER_BY_CREDENTIALS,
+            {"username": username, "hashed_password": hashed_password},
+        ).first()
         return query
 
     @retry(stop=stop_after_attempt(2), wait=wait_random(min=1, max=3), reraise=True)
@@ -90,8 +111,8 @@ class Database:
             self.session.rollback()
             raise ex
 
-    def get_session(self, token: str) -> CookieSession | None:
-        query = self.session.query(CookieSession).filter(CookieSession.token == token).first()
+    def get_session(self, token: str) -> Row[tuple[str, UUID, datetime, str]] | None:
+        query = self.session.execute(SELECT_SESSION_BY_TOKEN, {"token": token}).first()
         return query
 
     @retry(stop=stop_after_attempt(2), wait=wait_random(min=1, max=3), reraise=True)
@@ -109,7 +130,8 @@ class Database:
     #
 
     def get_user_by_uuid(self, user_uuid: UUID, raise_if_none: bool = False) -> User | None:
-        query = self.session.query(User).filter(User.uuid == user_uuid).first()
+        # Full entity is required here, as the task relationships are populated with it
+        query = self.session.scalars(SELECT_USER_BY_UUID, {"user_uuid": user_uuid}).first()
         if not query and raise_if_none:
             raise Exception(f"User with uuid {user_uuid} not found in the database")
         return query